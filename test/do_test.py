@@ -95,7 +95,7 @@ def get_all_tests() -> List[str]:
 
 def get_host_tests() -> List[str]:
     def filter_fn(test: str) -> bool:
-        return get_test_type(test) == 'host_test'
+        return get_test_type(test) in ('host_test', 'parallel_host_test')
     return list(filter(filter_fn, get_all_tests()))
 
 
@@ -126,6 +126,8 @@ def get_test_type(test: str) -> Optional[str]:
         return 'device_test'
     if testcase_name.startswith('TestExample'):
         return 'device_test'
+    if testcase_name == 'TestStackCollapse':
+        return 'parallel_host_test'
     if testcase_name in ('TestAnnotate',
                          'TestBinaryCacheBuilder',
                          'TestDebugUnwindReporter',
@@ -137,7 +139,6 @@ def get_test_type(test: str) -> Optional[str]:
                          'TestReportLib',
                          'TestReportSample',
                          'TestSampleFilter',
-                         'TestStackCollapse',
                          'TestTools',
                          'TestGeckoProfileGenerator'):
         return 'host_test'
@@ -400,6 +401,8 @@ class TestSummary:
 class TestManager:
     """ Create test processes, monitor their status and log test progresses. """
 
+    PARALLEL_HOST_TEST_WORKERS = 4
+
     def __init__(self, args: argparse.Namespace):
         self.repeat_count = args.repeat
         self.test_options = self._build_test_options(args)
@@ -431,6 +434,7 @@ class TestManager:
         device_tests = []
         device_serialized_tests = []
         host_tests = []
+        parallel_host_tests = []
         for test in tests:
             test_type = get_test_type(test)
             assert test_type, f'No test type for test {test}'
@@ -440,17 +444,20 @@ class TestManager:
                 device_serialized_tests.append(test)
             if test_type == 'host_test':
                 host_tests.append(test)
+            if test_type == 'parallel_host_test':
+                parallel_host_tests.append(test)
         total_test_count = (len(device_tests) + len(device_serialized_tests)
                             ) * len(self.devices) * self.repeat_count + len(host_tests)
+        total_test_count += len(parallel_host_tests)
         self.progress_bar = ProgressBar(total_test_count)
         self.test_summary = TestSummary(self.devices, device_tests + device_serialized_tests,
-                                        self.repeat_count, host_tests)
+                                        self.repeat_count, host_tests + parallel_host_tests)
         if device_tests:
             self.run_device_tests(device_tests)
         if device_serialized_tests:
             self.run_device_serialized_tests(device_serialized_tests)
-        if host_tests:
-            self.run_host_tests(host_tests)
+        if host_tests or parallel_host_tests:
+            self.run_host_tests(host_tests, parallel_host_tests)
         self.progress_bar.end_tests()
         self.progress_bar = None
 
@@ -467,10 +474,19 @@ class TestManager:
             test_proc = TestProcess('device_serialized_test', tests, device, 1, self.test_options)
             self.wait_for_test_results([test_proc], self.repeat_count)
 
-    def run_host_tests(self, tests: List[str]):
-        """ Tests run only once on host. """
-        test_proc = TestProcess('host_tests', tests, None, 1, self.test_options)
-        self.wait_for_test_results([test_proc], 1)
+    def run_host_tests(self, tests: List[str], parallel_tests: List[str]):
+        """ Tests run only once on host. Parallel tests are split among a few extra processes,
+            running alongside the process for other host tests.
+        """
+        test_procs: List[TestProcess] = []
+        if tests:
+            test_procs.append(TestProcess('host_tests', tests, None, 1, self.test_options))
+        worker_count = min(len(parallel_tests), self.PARALLEL_HOST_TEST_WORKERS)
+        for i in range(worker_count):
+            test_procs.append(TestProcess('parallel_host_tests_%d' % i,
+                                          parallel_tests[i::worker_count], None, 1,
+                                          self.test_options))
+        self.wait_for_test_results(test_procs, 1)
 
     def wait_for_test_results(self, test_procs: List[TestProcess], repeat_count: int):
         test_count = sum(len(test_proc.tests) for test_proc in test_procs)
@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import json
 import os
 from pathlib import Path
@@ -24,6 +25,11 @@ from typing import List, Optional, Set
 from . test_utils import TestBase, TestHelper
 
 
+@functools.lru_cache(maxsize=None)
+def _read_golden(path: str) -> str:
+    return Path(path).read_text()
+
+
 class TestStackCollapse(TestBase):
     def get_report(self, testdata_file: str, options: Optional[List[str]] = None) -> str:
         args = ['stackcollapse.py', '-i', TestHelper.testdata_path(testdata_file)]
@@ -35,37 +41,37 @@ class TestStackCollapse(TestBase):
     def test_jit_annotations(self):
         got = self.get_report('perf_with_jit_symbol.data', ['--jit'])
         golden_path = TestHelper.testdata_path('perf_with_jit_symbol.foldedstack')
-        self.assertEqual(got, Path(golden_path).read_text())
+        self.assertEqual(got, _read_golden(golden_path))
 
     def test_kernel_annotations(self):
         got = self.get_report('perf_with_jit_symbol.data', ['--kernel'])
         golden_path = TestHelper.testdata_path('perf_with_jit_symbol.foldedstack_with_kernel')
-        self.assertEqual(got, Path(golden_path).read_text())
+        self.assertEqual(got, _read_golden(golden_path))
 
     def test_with_pid(self):
         got = self.get_report('perf_with_jit_symbol.data', ['--jit', '--pid'])
         golden_path = TestHelper.testdata_path('perf_with_jit_symbol.foldedstack_with_pid')
-        self.assertEqual(got, Path(golden_path).read_text())
+        self.assertEqual(got, _read_golden(golden_path))
 
     def test_with_tid(self):
         got = self.get_report('perf_with_jit_symbol.data', ['--jit', '--tid'])
         golden_path = TestHelper.testdata_path('perf_with_jit_symbol.foldedstack_with_tid')
-        self.assertEqual(got, Path(golden_path).read_text())
+        self.assertEqual(got, _read_golden(golden_path))
 
     def test_two_event_types_chooses_first(self):
         got = self.get_report('perf_with_two_event_types.data')
         golden_path = TestHelper.testdata_path('perf_with_two_event_types.foldedstack')
-        self.assertEqual(got, Path(golden_path).read_text())
+        self.assertEqual(got, _read_golden(golden_path))
 
     def test_two_event_types_chooses_with_event_filter(self):
         got = self.get_report('perf_with_two_event_types.data', ['--event-filter', 'cpu-clock'])
         golden_path = TestHelper.testdata_path('perf_with_two_event_types.foldedstack_cpu_clock')
-        self.assertEqual(got, Path(golden_path).read_text())
+        self.assertEqual(got, _read_golden(golden_path))
 
     def test_unknown_symbol_addrs(self):
         got = self.get_report('perf_with_jit_symbol.data', ['--addrs'])
         golden_path = TestHelper.testdata_path('perf_with_jit_symbol.foldedstack_addrs')
-        self.assertEqual(got, Path(golden_path).read_text())
+        self.assertEqual(got, _read_golden(golden_path))
 
     def test_sample_filters(self):
         def get_threads_for_filter(filter: str) -> Set[int]:
@@ -89,7 +95,7 @@ class TestStackCollapse(TestBase):
         self.assertIn(31850, get_threads_for_filter(
             '--include-thread-name com.example.android.displayingbitmaps'))
 
-        with tempfile.NamedTemporaryFile('w', delete=False) as filter_file:
+        with tempfile.NamedTemporaryFile('w', dir=self.test_dir, delete=False) as filter_file:
             filter_file.write('GLOBAL_BEGIN 684943449406175\nGLOBAL_END 684943449406176')
             filter_file.flush()
             threads = get_threads_for_filter('--filter-file ' + filter_file.name)
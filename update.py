@@ -16,6 +16,7 @@
 #
 """Downloads simpleperf prebuilts from the build server."""
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import glob
 import logging
 import os
@@ -24,8 +25,10 @@ import shlex
 import shutil
 import stat
 import subprocess
+import tempfile
 import textwrap
-from typing import List, Union
+from typing import List, Optional, Union
+import zipfile
 
 
 THIS_DIR = os.path.realpath(os.path.dirname(__file__))
@@ -95,12 +98,12 @@ def logger():
     return logging.getLogger(__name__)
 
 
-def check_call(cmd: Union[str, List[str]]):
+def check_call(cmd: Union[str, List[str]], cwd: Optional[str] = None):
     """Proxy for subprocess.check_call with logging."""
     if isinstance(cmd, list):
         cmd = shlex.join(cmd)
     logger().debug('check_call `%s`', cmd)
-    subprocess.run(cmd, shell=True, check=True)
+    subprocess.run(cmd, shell=True, check=True, cwd=cwd)
 
 
 def remove(path: Union[str, Path]):
@@ -114,17 +117,17 @@ def remove(path: Union[str, Path]):
         path.unlink()
 
 
-def fetch_artifact(branch, build, target, pattern):
-    """Fetches and artifact from the build server."""
+def fetch_artifact(branch, build, target, pattern, dest_dir='.'):
+    """Fetches and artifact from the build server into dest_dir."""
     logger().info('Fetching %s from %s %s (artifacts matching %s)', build,
                   target, branch, pattern)
     if target.startswith('local:'):
-        shutil.copyfile(target[6:], pattern)
+        shutil.copyfile(target[6:], os.path.join(dest_dir, os.path.basename(pattern)))
         return
     fetch_artifact_path = '/google/data/ro/projects/android/fetch_artifact'
     cmd = [fetch_artifact_path, '--branch', branch, '--target', target,
            '--bid', build, pattern]
-    check_call(cmd)
+    check_call(cmd, cwd=dest_dir)
 
 
 def start_branch(build):
@@ -159,7 +162,7 @@ def list_prebuilts() -> List[str]:
 
 def remove_old_release():
     """Removes the old prebuilts."""
-    old_prebuilts = list_prebuilts()
+    old_prebuilts = [p for p in list_prebuilts() if os.path.exists(p)]
     if not old_prebuilts:
         return
     logger().info('Removing old prebuilts %s', old_prebuilts)
@@ -171,45 +174,67 @@ def remove_old_release():
         remove(prebuilt)
 
 
-def install_new_release(branch, build):
-    """Installs the new release."""
-    for entry in bin_install_list:
-        install_entry(branch, build, 'bin', entry)
-    install_entry(branch, build, '.', script_install_entry)
-    unzip_simpleperf_scripts(script_install_entry.install_path)
+def install_new_release(branch, build) -> List[str]:
+    """Installs the new release, and returns the top-level paths installed."""
+    entries = [('bin', entry) for entry in bin_install_list]
+    entries.append(('.', script_install_entry))
+    # Fetches are independent network I/O, so run them concurrently. Each fetch
+    # downloads into its own dir, because several artifacts share a basename.
+    # The dirs are in the current dir, so installing is a rename on the same
+    # filesystem. Post-processing stays on the main thread.
+    with tempfile.TemporaryDirectory(dir='.') as tmp_dir:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {}
+            for install_dir, entry in entries:
+                fetch_dir = tempfile.mkdtemp(dir=tmp_dir)
+                future = executor.submit(fetch_artifact, branch, build, entry.target, entry.name,
+                                         fetch_dir)
+                futures[future] = (install_dir, entry, fetch_dir)
+            for future in as_completed(futures):
+                future.result()
+                install_dir, entry, fetch_dir = futures[future]
+                install_entry(install_dir, entry, fetch_dir)
+    script_paths = unzip_simpleperf_scripts(script_install_entry.install_path)
     install_repo_prop(branch, build)
+    return ['repo.prop', 'bin'] + script_paths
 
 
-def install_entry(branch, build, install_dir, entry):
-    """Installs one prebuilt file specified by entry."""
-    target = entry.target
-    name = entry.name
+def install_entry(install_dir, entry, fetch_dir):
+    """Installs one prebuilt file specified by entry, already fetched into fetch_dir."""
+    name = os.path.join(fetch_dir, os.path.basename(entry.name))
     install_path = os.path.join(install_dir, entry.install_path)
     need_strip = entry.need_strip
 
-    fetch_artifact(branch, build, target, name)
-    name = os.path.basename(name)
     exe_stat = os.stat(name)
     os.chmod(name, exe_stat.st_mode | stat.S_IEXEC)
     if need_strip:
         check_call(['strip', name])
     dir = os.path.dirname(install_path)
-    if not os.path.isdir(dir):
-        os.makedirs(dir)
-    shutil.move(name, install_path)
-
-
-def unzip_simpleperf_scripts(zip_path: str):
-    check_call('unzip %s' % zip_path)
+    os.makedirs(dir, exist_ok=True)
+    os.replace(name, install_path)
+
+
+def unzip_simpleperf_scripts(zip_path: str) -> List[str]:
+    """Installs scripts from zip_path, and returns the top-level paths installed."""
+    with zipfile.ZipFile(zip_path) as zf:
+        installed = {info.filename.split('/')[0] for info in zf.infolist()}
+        for info in zf.infolist():
+            path = zf.extract(info)
+            # zipfile doesn't restore permissions. Restore them to keep scripts executable.
+            mode = info.external_attr >> 16
+            if mode:
+                os.chmod(path, stat.S_IMODE(mode))
     remove(zip_path)
 
     # Move scripts.
     for sub_path in Path('scripts').iterdir():
         if sub_path.name not in ['bin', 'pylintrc', 'update.py', 'Android.bp']:
             shutil.move(sub_path, '.')
+            installed.add(sub_path.name)
     remove('scripts')
     remove('inferno/Android.bp')
     remove('CONTRIBUTING.md')
+    installed -= {'scripts', 'CONTRIBUTING.md'}
 
     # Move proto files.
     proto_dir = Path('proto')
@@ -217,6 +242,8 @@ def unzip_simpleperf_scripts(zip_path: str):
     for sub_path in Path.cwd().iterdir():
         if sub_path.suffix == '.proto':
             shutil.move(sub_path, proto_dir)
+            installed.discard(sub_path.name)
+    installed.add('proto')
 
     # Build testdata.
     testdata_dir = Path('test/testdata')
@@ -225,7 +252,9 @@ def unzip_simpleperf_scripts(zip_path: str):
         for sub_path in Path(source_dir).iterdir():
             shutil.move(sub_path, testdata_dir)
         remove(source_dir)
+        installed.discard(source_dir)
     remove(testdata_dir / 'Android.bp')
+    return sorted(installed)
 
 
 def install_repo_prop(branch, build):
@@ -267,8 +296,7 @@ def main():
     if not args.use_current_branch:
         start_branch(args.build)
     remove_old_release()
-    install_new_release(args.branch, args.build)
-    artifacts = ['repo.prop'] + list_prebuilts()
+    artifacts = install_new_release(args.branch, args.build)
     commit(args.branch, args.build, artifacts)
 
 